@@ -8,12 +8,14 @@ import numpy as np
 from nptyping import NDArray
 from numpy.testing import assert_allclose, assert_array_less
 from scipy.optimize import fmin_l_bfgs_b
+from scipy.spatial.distance import cdist
 
 from topsearch.data.coordinates import StandardCoordinates
 from topsearch.data.kinetic_transition_network import KineticTransitionNetwork
 from topsearch.data.model_data import ModelData
 from topsearch.potentials.potential import Potential
 from topsearch.similarity.similarity import StandardSimilarity
+from topsearch.utils.parallel import run_parallel
 
 
 def get_invalid_minima(ktn: KineticTransitionNetwork, potential: Potential, coords: StandardCoordinates) -> list[int]:
@@ -83,10 +85,7 @@ def get_minima_above_cutoff(ktn: KineticTransitionNetwork,
 
 def get_minima_energies(ktn: KineticTransitionNetwork) -> NDArray:
     """ Return the energies of all the minima """
-    energies = np.zeros((ktn.n_minima), dtype=float)
-    for i in range(ktn.n_minima):
-        energies[i] = ktn.get_minimum_energy(i)
-    return energies
+    return ktn.get_all_minimum_energies()
 
 
 def get_ordered_minima(ktn: KineticTransitionNetwork) -> NDArray:
@@ -95,9 +94,35 @@ def get_ordered_minima(ktn: KineticTransitionNetwork) -> NDArray:
     return np.argsort(energies)
 
 
-def get_distance_matrix(ktn: KineticTransitionNetwork, similarity: StandardSimilarity, coords: StandardCoordinates) -> NDArray:
-    """ Compute a distance matrix for all minima in the network """
+def is_euclidean(similarity: StandardSimilarity) -> bool:
+    """ Check if the similarity measure is the plain Euclidean distance,
+        i.e. no alignment is performed in closest_distance """
+    return (type(similarity).closest_distance is
+            StandardSimilarity.closest_distance and
+            type(similarity).distance is StandardSimilarity.distance)
+
+
+def get_distance_matrix(ktn: KineticTransitionNetwork, similarity: StandardSimilarity, coords: StandardCoordinates,
+                        processes: int = 1) -> NDArray:
+    """ Compute a distance matrix for all minima in the network. When
+        the similarity requires alignment the rows can be split over
+        multiple processes """
+    # Euclidean distances can be computed for all pairs at once
+    if is_euclidean(similarity) and ktn.n_minima > 0:
+        all_coords = ktn.get_all_minimum_coords()
+        return cdist(all_coords, all_coords, metric='euclidean')
     dist_matrix = np.zeros((ktn.n_minima, ktn.n_minima), dtype=float)
+    if processes > 1:
+        # Interleave rows so each process gets a similar number of pairs
+        row_sets = [list(range(k, ktn.n_minima-1, processes))
+                    for k in range(processes)]
+        for rows in run_parallel(get_distance_rows, row_sets,
+                                 [ktn, similarity, coords],
+                                 processes=processes):
+            for i, dist_vector in rows:
+                dist_matrix[i, i+1:] = dist_vector
+                dist_matrix[i+1:, i] = dist_vector
+        return dist_matrix
     for i in range(ktn.n_minima-1):
         coords.position = ktn.get_minimum_coords(i)
         for j in range(i+1, ktn.n_minima):
@@ -107,9 +132,28 @@ def get_distance_matrix(ktn: KineticTransitionNetwork, similarity: StandardSimil
     return dist_matrix
 
 
+def get_distance_rows(rows: list, ktn: KineticTransitionNetwork, similarity: StandardSimilarity,
+                      coords: StandardCoordinates) -> list:
+    """ Compute the distances of each minimum in rows from all minima with
+        a larger index. Returns a list of (row, distances) tuples """
+    dist_rows = []
+    for i in rows:
+        coords.position = ktn.get_minimum_coords(i)
+        dist_vector = np.zeros((ktn.n_minima-i-1), dtype=float)
+        for j in range(i+1, ktn.n_minima):
+            coords2 = ktn.get_minimum_coords(j)
+            dist_vector[j-i-1] = similarity.closest_distance(coords, coords2)
+        dist_rows.append((i, dist_vector))
+    return dist_rows
+
+
 def get_distance_from_minimum(ktn: KineticTransitionNetwork, similarity: StandardSimilarity, coords: StandardCoordinates,
                               node: int) -> NDArray:
     """ Compute the distance of all nodes from specified minimum node1 """
+    # Euclidean distances can be computed for all minima at once
+    if is_euclidean(similarity):
+        all_coords = ktn.get_all_minimum_coords()
+        return np.linalg.norm(all_coords - all_coords[node], axis=1)
     dist_vector = np.zeros((ktn.n_minima), dtype=float)
     coords.position = ktn.get_minimum_coords(node)
     for i in range(ktn.n_minima):
@@ -117,6 +161,28 @@ def get_distance_from_minimum(ktn: KineticTransitionNetwork, similarity: Standar
         dist_vector[i] = similarity.closest_distance(coords, coords2)
     return dist_vector
 
+def get_distances_from_minima(ktn: KineticTransitionNetwork, similarity: StandardSimilarity,
+                              coords: StandardCoordinates, nodes: list) -> NDArray:
+    """ Compute the distance of all minima from each minimum in nodes.
+        Row k of the returned matrix corresponds to nodes[k] """
+    nodes = list(nodes)
+    if is_euclidean(similarity) and ktn.n_minima > 0:
+        all_coords = ktn.get_all_minimum_coords()
+        return cdist(all_coords[nodes], all_coords, metric='euclidean')
+    dist_matrix = np.zeros((len(nodes), ktn.n_minima), dtype=float)
+    rows = {node: k for k, node in enumerate(nodes)}
+    for k, node in enumerate(nodes):
+        coords.position = ktn.get_minimum_coords(node)
+        for i in range(ktn.n_minima):
+            # Reuse distances already computed from an earlier row
+            if rows.get(i, k) < k:
+                dist_matrix[k, i] = dist_matrix[rows[i], node]
+            else:
+                coords2 = ktn.get_minimum_coords(i)
+                dist_matrix[k, i] = similarity.closest_distance(coords,
+                                                                coords2)
+    return dist_matrix
+
 def validate_minima(ktn: KineticTransitionNetwork, model_data: ModelData, coords: StandardCoordinates, interpolation: Potential) -> None:
     logger = logging.getLogger("minima_validation")
 
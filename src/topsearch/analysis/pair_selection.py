@@ -4,12 +4,13 @@
 import logging
 import numpy as np
 import networkx as nx
+from nptyping import NDArray
 from topsearch.data.coordinates import StandardCoordinates
 
 from topsearch.data.kinetic_transition_network import KineticTransitionNetwork
 from topsearch.similarity.similarity import StandardSimilarity
-from .graph_properties import unconnected_component
-from .minima_properties import get_distance_matrix, get_distance_from_minimum
+from .minima_properties import get_distance_matrix, \
+    get_distance_from_minimum, get_distances_from_minima, get_minima_energies
 logger = logging.getLogger()
 
 def connect_unconnected(ktn: KineticTransitionNetwork, similarity: StandardSimilarity,
@@ -21,61 +22,97 @@ def connect_unconnected(ktn: KineticTransitionNetwork, similarity: StandardSimil
     # Check for emptiness
     if ktn.n_minima == 0:
         return []
+    # Find each connected component once, rather than once per minimum
+    connected_components = list(nx.connected_components(ktn.G))
+    # Fully connected so nothing to do
+    if len(connected_components) == 1:
+        return []
+    components = {}
+    for component in connected_components:
+        component = frozenset(component)
+        for j in component:
+            components[j] = component
     # Get the set of minima not connected to the global minimum
-    unconnected_set = unconnected_component(ktn)
+    min_node = np.argmin(get_minima_energies(ktn))
+    unconnected_set = set(range(ktn.n_minima)) - components[min_node]
+    # Compute the distances from all unconnected minima together
+    unconnected_nodes = sorted(unconnected_set)
+    dist_matrix = get_distances_from_minima(ktn, similarity, coords,
+                                            unconnected_nodes)
     total_pairs = []
-    if len(unconnected_set) > 0:
-        for i in unconnected_set:
-            pairs = connect_to_set(ktn, similarity, coords, i, neighbours)
-            for j in pairs:
-                total_pairs.append(j)
+    for i, dist_vector in zip(unconnected_nodes, dist_matrix):
+        pairs = connect_to_set(ktn, similarity, coords, i, neighbours,
+                               components[i], dist_vector)
+        for j in pairs:
+            total_pairs.append(j)
     # Can generate a lot of repeats so remove any repeated pairs
     total_pairs = unique_pairs(total_pairs)
     return total_pairs
 
 
 def connect_to_set(ktn: KineticTransitionNetwork, similarity: StandardSimilarity, coords: StandardCoordinates,
-                   node1: int, cycles: int) -> list:
+                   node1: int, cycles: int, s_set: set = None,
+                   dist_vector: NDArray = None) -> list:
     """
     Finds all minima connected to node1 and finds the pairs closest
     in distance where one is connected and one is not. Returns the
-    set of minima pairs in a list for use in connect_unconnected
+    set of minima pairs in a list for use in connect_unconnected.
+    The set of minima connected to node1, and the distances of all
+    minima from node1, can be given as s_set and dist_vector if
+    already known
     """
 
     # Set of nodes connected to node1
-    s_set = nx.node_connected_component(ktn.G, node1)
+    if s_set is None:
+        s_set = nx.node_connected_component(ktn.G, node1)
     # Find list of nodes not connected to node 1
     f_set = set(range(ktn.n_minima)) - set(s_set)
     if f_set == set():
         logger.info("No unconnected minima\n")
         return []
-    # Get ordered distances to this node
-    dist_vector = get_distance_from_minimum(ktn, similarity, coords, node1)
-    nearest = np.argsort(dist_vector).tolist()[1:]
-    # Remove any minima in same set
-    pairs = [i for i in nearest if i in f_set]
+    # Get distances to this node, restricted to minima not in same set
+    if dist_vector is None:
+        dist_vector = get_distance_from_minimum(ktn, similarity, coords,
+                                                node1)
+    f_nodes = np.array(sorted(f_set))
+    # Only the closest cycles minima are needed so avoid a full sort
+    pairs = f_nodes[nearest_indices(dist_vector[f_nodes], cycles)].tolist()
     total_pairs = []
-    for i in pairs[:cycles]:
+    for i in pairs:
         total_pairs.append([node1, i])
     return unique_pairs(total_pairs)
 
 
 def closest_enumeration(ktn: KineticTransitionNetwork, similarity: StandardSimilarity,
-                        coords: StandardCoordinates, neighbours: int) -> list:
+                        coords: StandardCoordinates, neighbours: int,
+                        processes: int = 1) -> list:
     """
     Selector that attempts to connect all minima in the fewest number of
     attempts by connecting each minimum to its N nearest neighbours.
     Returns a list of pairs
     """
     pairs = []
-    dist_matrix = get_distance_matrix(ktn, similarity, coords)
+    dist_matrix = get_distance_matrix(ktn, similarity, coords, processes)
     for i in range(ktn.n_minima):
-        nearest = np.argsort(dist_matrix[i, :]).tolist()[1:neighbours+1]
+        nearest = nearest_indices(dist_matrix[i, :],
+                                  neighbours+1).tolist()[1:]
         for j in nearest:
             pairs.append([i, j])
     return unique_pairs(pairs)
 
 
+def nearest_indices(dist_vector: NDArray, k: int) -> NDArray:
+    """ Return the indices of the k smallest values in dist_vector, ordered
+        by increasing distance. Uses a partition so only the selected
+        entries are sorted """
+    if k <= 0:
+        return np.empty(0, dtype=int)
+    if k >= dist_vector.size:
+        return np.argsort(dist_vector)
+    nearest = np.argpartition(dist_vector, k-1)[:k]
+    return nearest[np.argsort(dist_vector[nearest])]
+
+
 def read_pairs(text_path: str = ''):
     """ Read the set of pairs from the file pairs.txt """
     pairs = np.genfromtxt(f'{text_path}pairs.txt', dtype=int)
@@ -83,7 +120,15 @@ def read_pairs(text_path: str = ''):
 
 
 def unique_pairs(initial_pairs: list) -> list:
-    """ Remove any repeated pairs from a given list """
-    # Sort the pairs as [0, 1] and [1, 0] are equivalent
-    final_pairs = [tuple(sorted(i)) for i in initial_pairs if i != [0, 0]]
-    return [list(i) for i in set(final_pairs)]
+    """ Remove any repeated pairs from a given list. Returns the
+        pairs ordered by first and then second minimum """
+    pairs = np.asarray(initial_pairs, dtype=np.int64).reshape(-1, 2)
+    pairs = pairs[np.any(pairs != 0, axis=1)]
+    # Sort the pairs as [0, 1] and [1, 0] are equivalent, and pack
+    # each into a single integer so repeats can be found by np.unique
+    lower = np.min(pairs, axis=1).astype(np.uint64)
+    upper = np.max(pairs, axis=1).astype(np.uint64)
+    packed = np.unique((lower << np.uint64(32)) | upper)
+    final_pairs = np.column_stack((packed >> np.uint64(32),
+                                   packed & np.uint64(0xFFFFFFFF)))
+    return final_pairs.tolist()
@@ -63,6 +63,24 @@ class KineticTransitionNetwork:
         """ Returns the energy of a given node minimum """
         return self.G.nodes[minimum]['energy']
 
+    def get_all_minimum_coords(self) -> NDArray:
+        """ Returns the coordinates of all minima as a single 2d array,
+            with row i giving the coordinates of minimum i """
+        nodes = self.G.nodes
+        return np.array([nodes[i]['coords'] for i in range(self.n_minima)],
+                        dtype=float)
+
+    def get_all_minimum_energies(self) -> NDArray:
+        """ Returns the energies of all minima as a single 1d array """
+        nodes = self.G.nodes
+        energies = np.empty(self.n_minima, dtype=float)
+        for i in range(self.n_minima):
+            e = nodes[i]['energy']
+            if hasattr(e, '__iter__'):
+                e = e[0]
+            energies[i] = e
+        return energies
+
     def get_ts_coords(self, min_plus: int, min_minus: int, edge_index: int = 0) -> NDArray:
         """ Returns coordinates of edge_index-th ts edge between min_plus and min_minus """
         return self.G[min_plus][min_minus][edge_index]['coords']
@@ -87,21 +105,22 @@ class KineticTransitionNetwork:
 
     def remove_minimum(self, minimum: int) -> None:
         """ Remove a node from the network correpsonding to index minimum """
-        new_order = np.arange(self.n_minima)
-        new_order[minimum] = self.n_minima+1
-        for i in range(minimum, self.n_minima):
-            new_order[i] -= 1
-        mapping = dict(zip(np.arange(self.n_minima), new_order))
-        self.G = nx.relabel_nodes(self.G, mapping, copy=True)
-        # Will remove any edges connected to this node so reduce n_ts
-        self.n_ts -= len(self.G.edges(self.n_minima))
-        self.G.remove_node(self.n_minima)
-        self.n_minima -= 1
+        self.remove_minima([minimum])
 
     def remove_minima(self, minima: list[int]) -> None:
         """ Remove the nodes with the given indices in removed_minima """
-        for c, i in enumerate(np.sort(minima), 0):
-            self.remove_minimum(i-c)
+        removed = set(int(i) for i in minima)
+        if not removed:
+            return
+        # Remove all nodes at once, which also removes their edges
+        n_edges = self.G.number_of_edges()
+        self.G.remove_nodes_from(removed)
+        self.n_ts -= n_edges - self.G.number_of_edges()
+        # Relabel the remaining nodes so indices are contiguous again
+        keep = [i for i in range(self.n_minima) if i not in removed]
+        mapping = {old: new for new, old in enumerate(keep)}
+        self.G = nx.relabel_nodes(self.G, mapping, copy=True)
+        self.n_minima -= len(removed)
 
     def remove_ts(self, minimum1: int, minimum2: int, edge_index: int = -1) -> None:
         """ Remove the edge_index-th transition state connecting the two passed minima 
@@ -113,19 +132,24 @@ class KineticTransitionNetwork:
 
     def remove_all_ts(self, minimum1: int, minimum2: int) -> None:
         """ Removes all transition states connecting the two passed minima"""
-        while self.G.number_of_edges(minimum1,minimum2):
-            self.G.remove_edge(minimum1, minimum2)
-            self.n_ts -= 1
+        self.remove_all_tss([(minimum1, minimum2)])
 
     def remove_tss(self, minima: list) -> None:
-        """ Remove an array of transition states in one go """
-        for i in minima:
-            self.remove_ts(i[0], i[1])
+        """ Remove an array of transition states in one go, the latest
+            TS added between each pair of minima is removed """
+        n_edges = self.G.number_of_edges()
+        self.G.remove_edges_from((i[0], i[1]) for i in minima)
+        self.n_ts -= n_edges - self.G.number_of_edges()
 
     def remove_all_tss(self, minima: list) -> None:
         """ Remove all transition states between minima in one go """
+        edges = []
         for i in minima:
-            self.remove_all_ts(i[0], i[1])
+            edge_data = self.G.get_edge_data(i[0], i[1], default={})
+            edges.extend((i[0], i[1], key) for key in edge_data)
+        n_edges = self.G.number_of_edges()
+        self.G.remove_edges_from(edges)
+        self.n_ts -= n_edges - self.G.number_of_edges()
 
     #  INPUT/OUTPUT FUNCTIONS
 
@@ -136,6 +160,21 @@ class KineticTransitionNetwork:
         self.n_ts = 0
         self.pairlist = np.empty((0, 2), dtype=int)
 
+    def get_all_ts_data(self) -> tuple[NDArray, NDArray, NDArray]:
+        """ Returns the connected minima, energies and coordinates of all
+            transition states as arrays, in the order of G.edges """
+        # Get dimensionality of minima
+        ndim = self.get_minimum_coords(0).shape[0]
+        n_edges = self.G.number_of_edges()
+        ts_minima = np.empty((n_edges, 2), dtype=int)
+        ts_energies = np.empty(n_edges, dtype=float)
+        ts_coords = np.empty((n_edges, ndim), dtype=float)
+        for i, (node1, node2, edge_data) in enumerate(self.G.edges(data=True)):
+            ts_minima[i, :] = [node1, node2]
+            ts_energies[i] = edge_data['energy']
+            ts_coords[i, :] = edge_data['coords']
+        return ts_minima, ts_energies, ts_coords
+
     def dump_network(self, text_string: str = '', text_path: str ='') -> None:
         """
         Write network to text files:
@@ -150,34 +189,21 @@ class KineticTransitionNetwork:
         else:
             dump_dir = Path(text_path)    
 
-        # Get dimensionality of minima
-        ndim = self.get_minimum_coords(0).shape[0]
         # Get minima data out of network
-        minima_data = np.empty((0, 2), dtype=object)
-        minima_coords = np.empty((0, ndim), dtype=object)
-        for i in range(self.n_minima):
-            e = self.G.nodes[i]['energy']
-            if not hasattr(e, '__iter__'):
-                    e = [e]
-            minima_data = np.append(
-                minima_data, [[i, e[0]]], axis=0)
-            minima_coords = np.append(
-                minima_coords, [self.G.nodes[i]['coords']], axis=0)
+        minima_energies = self.get_all_minimum_energies()
+        minima_coords = self.get_all_minimum_coords()
         # Get transition state data out of the network
-        ts_data = np.empty((0, 3), dtype=object)
-        ts_coords = np.empty((0, ndim), dtype=object)
-        for node1, node2, edge_idx in self.G.edges:
-            ts_data = np.append(
-                ts_data,
-                [[node1, node2, self.G[node1][node2][edge_idx]['energy']]], axis=0)
-            ts_coords = np.append(
-                ts_coords, [self.G[node1][node2][edge_idx]['coords']], axis=0)
+        ts_minima, ts_energies, ts_coords = self.get_all_ts_data()
         # Write stationary point data and pairlist
-        np.savetxt(dump_dir / f"ts.data{text_string}",
-                   ts_data, fmt='%i %i %.16e')
+        with open(dump_dir / f"ts.data{text_string}", 'w',
+                  encoding="utf-8") as ts_file:
+            ts_file.writelines(f"{j[0]} {j[1]} {e:.16e}\n"
+                               for j, e in zip(ts_minima, ts_energies))
         np.savetxt(dump_dir / f"ts.coords{text_string}", ts_coords)
-        np.savetxt(dump_dir / f"min.data{text_string}",
-                   minima_data, fmt='%i %.16e')
+        with open(dump_dir / f"min.data{text_string}", 'w',
+                  encoding="utf-8") as min_file:
+            min_file.writelines(f"{i} {e:.16e}\n"
+                                for i, e in enumerate(minima_energies))
         np.savetxt(dump_dir / f"min.coords{text_string}", minima_coords)
         np.savetxt(dump_dir / f"pairlist{text_string}", self.pairlist, fmt='%i')
         np.savetxt(dump_dir / f"attempted.coords{text_string}", self.get_attempted_positions())
@@ -215,6 +241,60 @@ class KineticTransitionNetwork:
             self.G.add_edge(int(ts_data[i, 0]), int(ts_data[i, 1]),
                             energy=ts_data[i, 2], coords=ts_coords[i, :])
 
+    def dump_network_npz(self, text_string: str = '', text_path: str = '') -> None:
+        """
+        Write network to a single binary file network.npz, which is much
+        faster to write and read than the text files of dump_network
+        """
+        if text_string == '':
+            text_string = self.dump_suffix
+        if text_path == '':
+            dump_dir = self.dump_path
+        else:
+            dump_dir = Path(text_path)
+
+        ts_minima, ts_energies, ts_coords = self.get_all_ts_data()
+        with open(dump_dir / f"network{text_string}.npz", 'wb') as npz_file:
+            np.savez(npz_file,
+                     minima_energies=self.get_all_minimum_energies(),
+                     minima_coords=self.get_all_minimum_coords(),
+                     ts_minima=ts_minima,
+                     ts_energies=ts_energies,
+                     ts_coords=ts_coords,
+                     pairlist=self.pairlist,
+                     attempted_coords=self.get_attempted_positions())
+
+    def read_network_npz(self, text_path: str = '', text_string: str = '') -> None:
+        """ Returns G network from the file that resulted from
+            dump_network_npz """
+        if text_string == '':
+            text_string = self.dump_suffix
+        if text_path == '':
+            dump_dir = self.dump_path
+        else:
+            dump_dir = Path(text_path)
+
+        with np.load(dump_dir / f"network{text_string}.npz") as data:
+            minima_energies = data['minima_energies']
+            minima_coords = data['minima_coords']
+            ts_minima = data['ts_minima']
+            ts_energies = data['ts_energies']
+            ts_coords = data['ts_coords']
+            self.pairlist = data['pairlist'].reshape(-1, 2)
+            self.initial_positions_attempted = \
+                data['attempted_coords'].tolist()
+
+        # Now build a graph from the data
+        self.n_minima = minima_energies.size
+        self.G.add_nodes_from(
+            (i, {'energy': minima_energies[i], 'coords': minima_coords[i, :]})
+            for i in range(self.n_minima))
+        self.n_ts = ts_energies.size
+        self.G.add_edges_from(
+            (int(ts_minima[i, 0]), int(ts_minima[i, 1]),
+             {'energy': ts_energies[i], 'coords': ts_coords[i, :]})
+            for i in range(self.n_ts))
+
     def dump_minima_csv(self, text_string: str = '') -> None:
         """ Method to dump all the minima into a csv format """
         with open(f'mol_data{text_string}.csv',
@@ -249,9 +329,8 @@ class KineticTransitionNetwork:
                                    min1_coords, min1_energy,
                                    min2_coords, min2_energy)
         # Combine the pairlist files
-        for i in other_ktn.pairlist:
-            self.pairlist = np.append(
-                self.pairlist, np.array([np.sort(i)]), axis=0)
+        self.pairlist = np.vstack(
+            [self.pairlist, np.sort(np.asarray(other_ktn.pairlist), axis=1)])
 
     def add_attempted_position(self, position: np.ndarray) -> None:
         self.initial_positions_attempted.append(position)
@@ -2,11 +2,13 @@
     with the kinetic transition network containing minima and
     transition states overlaid onto it """
 
+from matplotlib.collections import LineCollection
 from matplotlib.colors import Colormap
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 from matplotlib import rc
 import numpy as np
+import networkx as nx
 from nptyping import NDArray
 from topsearch.data.kinetic_transition_network import KineticTransitionNetwork
 
@@ -28,41 +30,35 @@ def plot_stationary_points(potential: Potential, ktn: KineticTransitionNetwork,
 
     plt.figure()
     cmap = plt.get_cmap(colour_scheme, contour_levels+1)
-    # Get the coordinates of all minima and their labels
-    min_labels = []
-    minima = np.zeros((ktn.n_minima, 2))
-    for i in range(ktn.n_minima):
-        minima[i, :] = ktn.get_minimum_coords(i)
-        min_labels.append([minima[i, 0], minima[i, 1], i])
+    # Get the coordinates of all minima
+    minima = ktn.get_all_minimum_coords().reshape(ktn.n_minima, 2)
     # Get the function contours
     contour_set = plot_contours(potential, bounds, fineness,
                                 contour_levels, cmap)
+    # Get transition states and their minima without self-connections
+    n_ts = len(ktn.G.edges)-self_connected(ktn)
+    ts_coords = np.zeros((n_ts, 2))
+    ts_minima = np.zeros((n_ts, 2), dtype=int)
     count = 0
-    # Initialise transition state array without self-connections
-    selfconnected = self_connected(ktn)
-    ts_coords = np.zeros((len(ktn.G.edges)-selfconnected, 2))
-    # Plot the connections between minima and transition states
-    for node1, node2, edge_index in ktn.G.edges:
+    for node1, node2, coords in ktn.G.edges(data='coords'):
         if node1 == node2:
             continue
-        ts_coords[count, :] = ktn.get_ts_coords(node1, node2, edge_index)
-        # Arrows to show connections between transition states and minima
-        plt.arrow(ts_coords[count, 0], ts_coords[count, 1],
-                  minima[node1, 0] - ts_coords[count, 0],
-                  minima[node1, 1] - ts_coords[count, 1],
-                  zorder=1)
-        plt.arrow(ts_coords[count, 0], ts_coords[count, 1],
-                  minima[node2, 0] - ts_coords[count, 0],
-                  minima[node2, 1] - ts_coords[count, 1],
-                  zorder=1)
+        ts_coords[count, :] = coords
+        ts_minima[count, :] = [node1, node2]
         count += 1
+    # Lines to show connections between transition states and minima
+    segments = np.concatenate(
+        (np.stack((ts_coords, minima[ts_minima[:, 0]]), axis=1),
+         np.stack((ts_coords, minima[ts_minima[:, 1]]), axis=1)))
+    plt.gca().add_collection(LineCollection(segments, colors='k',
+                                            linewidths=0.5, zorder=1))
     # Add the minima and transition states
     plt.scatter(ts_coords[:, 0], ts_coords[:, 1], c='r', zorder=3, s=2.0)
     plt.scatter(minima[:, 0], minima[:, 1], c='g', zorder=3, s=2.0)
     # Add the numerical labels for each minimum
     if label_min:
-        for i in min_labels:
-            plt.text(i[0], i[1], str(i[2]), fontsize=5)
+        for i, min_coords in enumerate(minima):
+            plt.text(min_coords[0], min_coords[1], str(i), fontsize=5)
     # Add labels and write to disc
     plt.xlabel(r'$x$')
     plt.ylabel(r'$y$')
@@ -78,11 +74,7 @@ def plot_stationary_points(potential: Potential, ktn: KineticTransitionNetwork,
 
 def self_connected(ktn: KineticTransitionNetwork) -> int:
     """ Count the number of edges that connect minima to themselves """
-    selfconnected = 0
-    for node1, node2 in ktn.G.edges():
-        if node1 == node2:
-            selfconnected += 1
-    return selfconnected
+    return nx.number_of_selfloops(ktn.G)
 
 
 def make_xy_grid(bounds: list, fineness: int) -> tuple[NDArray, NDArray]:
@@ -108,14 +100,7 @@ def compute_function_grid(potential: Potential, x_array: NDArray,
                           y_array: NDArray, fineness: int) -> NDArray:
     """ Returns the function value evaluated for the grid of
         meshgrid input for plotting """
-    z_array = []
-    for i in map(lambda x: function_call(potential, x),
-                 zip(x_array.flatten(), y_array.flatten())):
-        z_array.append(i)
+    points = np.column_stack((x_array.ravel(), y_array.ravel()))
+    z_array = potential.function_batch(points)
     return np.asarray(z_array).reshape((fineness, fineness))
 
-
-def function_call(potential: Potential, x_value: NDArray) -> float:
-    """ Returns function value """
-    x_tmp = np.array(x_value)
-    return potential.function(x_tmp)
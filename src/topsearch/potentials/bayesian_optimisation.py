@@ -2,14 +2,28 @@
     in Bayesian optimisation. Both expected improvement and upper confidence
     bound are available """
 
-import scipy.stats
+from math import erf, exp, pi, sqrt
 import numpy as np
 from nptyping import NDArray
+from scipy.special import ndtr
 
 from topsearch.potentials.gaussian_process import GaussianProcess
 from .potential import Potential
 
 
+def expected_improvement(mean: NDArray, std: NDArray, current_max: float,
+                         zeta: float) -> NDArray:
+    """ Closed-form expected improvement for arrays of GP means and standard
+        deviations, using the normal cdf and pdf directly """
+    prefactor = mean - current_max - zeta
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = prefactor/std
+        improvement = prefactor*ndtr(z) + \
+            std*np.exp(-0.5*z*z)/np.sqrt(2.0*np.pi)
+    # Limit of zero variance is the improvement of the mean
+    return np.where(std > 0.0, improvement, np.maximum(prefactor, 0.0))
+
+
 class ExpectedImprovement(Potential):
 
     """
@@ -28,20 +42,50 @@ class ExpectedImprovement(Potential):
     zeta : float
         Parameter in the acquisition functions that controls exploration vs
         exploitation
+    cached_response : numpy array
+        The response array from which cached_max was computed
+    cached_max : float
+        The maximum of cached_response
     """
 
     def __init__(self, gaussian_process: GaussianProcess, zeta: float) -> None:
         self.atomistic = False
         self.gaussian_process = gaussian_process
         self.zeta = zeta
+        self.cached_response = None
+        self.cached_max = None
+
+    def current_max(self) -> float:
+        """ Return the maximum of the response data. ModelData replaces the
+            response array whenever it changes, so the maximum is only
+            recomputed when the array is a different object """
+        response = self.gaussian_process.model_data.response
+        if response is not self.cached_response:
+            self.cached_max = np.max(response)
+            self.cached_response = response
+        return self.cached_max
 
     def function(self, position: NDArray) -> float:
-        """ Return the expected improvement at position """
-        current_max = np.max(self.gaussian_process.model_data.response)
+        """ Return the expected improvement at position. Evaluated with
+            the math module as scipy and numpy dispatch dominates for
+            a single point """
+        current_max = self.current_max()
         mean, std = self.gaussian_process.function_and_std(position)
-        prefactor = mean - current_max - self.zeta
-        return prefactor*scipy.stats.norm.cdf(prefactor/std) + \
-            std*scipy.stats.norm.pdf(prefactor/std)
+        prefactor = float(mean[0]) - current_max - self.zeta
+        std = float(std[0])
+        # Limit of zero variance is the improvement of the mean
+        if std <= 0.0:
+            return max(prefactor, 0.0)
+        z = prefactor/std
+        cdf = 0.5*(1.0 + erf(z/sqrt(2.0)))
+        pdf = exp(-0.5*z*z)/sqrt(2.0*pi)
+        return prefactor*cdf + std*pdf
+
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Return the expected improvement at each row of positions """
+        current_max = self.current_max()
+        mean, std = self.gaussian_process.function_and_std_batch(positions)
+        return expected_improvement(mean, std, current_max, self.zeta)
 
 
 class UpperConfidenceBound(Potential):
@@ -73,3 +117,9 @@ class UpperConfidenceBound(Potential):
         """ Return the value of the acquisition function """
         mean, std = self.gaussian_process.function_and_std(position)
         return float(mean - self.zeta*std)
+
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Return the value of the acquisition function at each row of
+            positions """
+        mean, std = self.gaussian_process.function_and_std_batch(positions)
+        return mean - self.zeta*std
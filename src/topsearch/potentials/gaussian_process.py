@@ -143,10 +143,19 @@ class GaussianProcess(Potential):
         """ Return the mean of the GP fit at position """
         return self.gpr.predict(position.reshape(1, -1))[0]
 
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Return the mean of the GP fit at each row of positions """
+        return self.gpr.predict(positions)
+
     def function_and_std(self, position: NDArray) -> float:
         """ Return the mean and variance of the GP fit at position """
         return self.gpr.predict(position.reshape(1, -1), return_std=True)
 
+    def function_and_std_batch(self, positions: NDArray) -> tuple[NDArray, NDArray]:
+        """ Return the mean and variance of the GP fit at each row of
+            positions """
+        return self.gpr.predict(positions, return_std=True)
+
     def refit_model(self, n_restarts: int = 50) -> None:
         """ Refit the GP model based on the current model_data """
         self.gpr.n_restarts_optimizer = n_restarts
@@ -32,6 +32,13 @@ class Potential:
         """ Evaluate the function at a given point """
         return 0.0
 
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Evaluate the function at each row of positions
+            Returns 1d array of function values. Overridden by classes
+            that can evaluate many points at once """
+        return np.fromiter((self.function(i) for i in positions),
+                           dtype=float, count=positions.shape[0])
+
     def gradient(self, position: NDArray,
                  displacement: float = 1e-6) -> NDArray:
         """
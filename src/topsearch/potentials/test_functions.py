@@ -30,6 +30,10 @@ class Camelback(Potential):
         f_val = term1 + term2 + term3
         return f_val
 
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Return function evaluated at each row of positions """
+        return self.function(positions.T)
+
     def gradient(self, position: NDArray) -> NDArray:
         """ Return gradient vector evaluated at position """
         x, y = position
@@ -74,6 +78,12 @@ class Schwefel(Potential):
             sum_term += i * np.sin(np.sqrt(np.abs(i)))
         return const_term-sum_term
 
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Returns the Schwefel function evaluated at each row of positions """
+        const_term = 418.9829*positions.shape[1]
+        return const_term - np.sum(positions*np.sin(np.sqrt(np.abs(positions))),
+                                   axis=1)
+
 
 class Quadratic(Potential):
 
@@ -96,3 +106,7 @@ class Quadratic(Potential):
         for i in position:
             f_val += i**2
         return f_val
+
+    def function_batch(self, positions: NDArray) -> NDArray:
+        """ Return the quadratic function value at each row of positions """
+        return np.sum(positions**2, axis=1)
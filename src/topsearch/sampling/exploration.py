@@ -330,8 +330,9 @@ class NetworkSampling:
         self.logger.debug("-----------------\n")
         #  Run the pair selection method
         if option == "ClosestEnumeration":
+            processes = self.n_processes if self.multiprocessing_on else 1
             pairs = closest_enumeration(self.ktn, self.similarity,
-                                        coords, neighbours)
+                                        coords, neighbours, processes)
         elif option == "ConnectUnconnected":
             pairs = connect_unconnected(self.ktn, self.similarity,
                                         coords, neighbours)
@@ -4,11 +4,13 @@ import os
 from topsearch.data.kinetic_transition_network import KineticTransitionNetwork
 from topsearch.data.coordinates import StandardCoordinates
 from topsearch.similarity.similarity import StandardSimilarity
+from topsearch.similarity.molecular_similarity import MolecularSimilarity
 from topsearch.potentials.test_functions import Schwefel
 from topsearch.analysis.minima_properties import get_bounds_minima, \
         get_minima_above_cutoff, get_minima_energies, get_ordered_minima, \
         get_all_bounds_minima, get_similar_minima, get_invalid_minima, \
-        get_distance_matrix, get_distance_from_minimum, validate_minima
+        get_distance_matrix, get_distance_from_minimum, validate_minima, \
+        is_euclidean, get_distances_from_minima
 
 current_dir = os.path.dirname(os.path.dirname((os.path.realpath(__file__))))
 
@@ -123,6 +125,77 @@ def test_get_distance_matrix():
     assert np.all(dist_vector == pytest.approx([0.0, 6.64842106,
                                                 8.1389305, 7.79272806]))
 
+def test_is_euclidean():
+    assert is_euclidean(StandardSimilarity(0.1, 0.1)) is True
+    assert is_euclidean(MolecularSimilarity(0.1, 0.1)) is False
+
+def test_get_distance_matrix_loop():
+    coords = StandardCoordinates(ndim=3, bounds=[(-5.0, 5.0),
+                                                 (-5.0, 5.0),
+                                                 (-5.0, 5.0)])
+    similarity = StandardSimilarity(0.1, 0.1)
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.analysis')
+    dist_matrix = get_distance_matrix(ktn, similarity, coords)
+    for i in range(ktn.n_minima):
+        coords.position = ktn.get_minimum_coords(i)
+        for j in range(ktn.n_minima):
+            dist = similarity.closest_distance(coords,
+                                               ktn.get_minimum_coords(j))
+            assert dist_matrix[i, j] == pytest.approx(dist)
+
+class LoopSimilarity(StandardSimilarity):
+    """ Euclidean similarity that is not detected as Euclidean, to test
+        the pairwise loop """
+    def closest_distance(self, coords1, coords2):
+        return super().closest_distance(coords1, coords2)
+
+def test_get_distances_from_minima():
+    coords = StandardCoordinates(ndim=3, bounds=[(-5.0, 5.0),
+                                                 (-5.0, 5.0),
+                                                 (-5.0, 5.0)])
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.analysis')
+    nodes = [6, 2, 4]
+    for similarity in [StandardSimilarity(0.1, 0.1), LoopSimilarity(0.1, 0.1)]:
+        dist_matrix = get_distances_from_minima(ktn, similarity,
+                                                coords, nodes)
+        assert dist_matrix.shape == (3, ktn.n_minima)
+        for k, node in enumerate(nodes):
+            dist_vector = get_distance_from_minimum(ktn, similarity,
+                                                    coords, node)
+            assert np.all(dist_matrix[k, :] == pytest.approx(dist_vector))
+
+def test_get_distance_matrix_parallel():
+    coords = StandardCoordinates(ndim=3, bounds=[(-5.0, 5.0),
+                                                 (-5.0, 5.0),
+                                                 (-5.0, 5.0)])
+    similarity = LoopSimilarity(0.1, 0.1)
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.analysis')
+    serial_matrix = get_distance_matrix(ktn, similarity, coords)
+    parallel_matrix = get_distance_matrix(ktn, similarity, coords,
+                                          processes=2)
+    assert np.all(parallel_matrix == pytest.approx(serial_matrix))
+    assert np.all(parallel_matrix == pytest.approx(parallel_matrix.T))
+
+def test_get_distance_from_minimum_loop():
+    coords = StandardCoordinates(ndim=3, bounds=[(-5.0, 5.0),
+                                                 (-5.0, 5.0),
+                                                 (-5.0, 5.0)])
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.analysis')
+    dist_vector = get_distance_from_minimum(
+        ktn, StandardSimilarity(0.1, 0.1), coords, 5)
+    loop_vector = get_distance_from_minimum(
+        ktn, LoopSimilarity(0.1, 0.1), coords, 5)
+    assert dist_vector.shape == (ktn.n_minima,)
+    assert np.all(dist_vector == pytest.approx(loop_vector))
+
 @pytest.fixture
 def ktn_single_minimum() -> KineticTransitionNetwork:
     ktn = KineticTransitionNetwork()
@@ -70,6 +70,29 @@ def test_read_network_with_single_ts(tmp_path):
 
     assert_array_equal(ktn.get_ts_coords(0,1), np.array([0.5,0.5]))
 
+def test_dump_read_network_npz(tmp_path):
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.ktn_multipleTS')
+    ktn.pairlist = np.array([[0, 1], [3, 4]])
+    ktn.dump_network_npz(text_string='.npz_test', text_path=str(tmp_path))
+    ktn_new = KineticTransitionNetwork()
+    ktn_new.read_network_npz(text_path=str(tmp_path),
+                             text_string='.npz_test')
+    assert ktn_new.n_minima == ktn.n_minima
+    assert ktn_new.n_ts == ktn.n_ts
+    assert list(ktn_new.G.edges) == list(ktn.G.edges)
+    for i in range(ktn.n_minima):
+        assert_array_equal(ktn_new.get_minimum_coords(i),
+                           ktn.get_minimum_coords(i))
+        assert ktn_new.get_minimum_energy(i) == ktn.get_minimum_energy(i)
+    for u, v, edge_index in ktn.G.edges:
+        assert_array_equal(ktn_new.get_ts_coords(u, v, edge_index),
+                           ktn.get_ts_coords(u, v, edge_index))
+        assert ktn_new.get_ts_energy(u, v, edge_index) == \
+            ktn.get_ts_energy(u, v, edge_index)
+    assert_array_equal(ktn_new.pairlist, ktn.pairlist)
+
 def test_read_network_with_multiple_ts_per_node():
      # check result for a kinetic transition network where nodes 0, 1 have two transition states
     ktn = KineticTransitionNetwork()
@@ -200,6 +223,24 @@ def test_get_minimum_energy():
     assert energy2 == pytest.approx(-1.67184)
     assert energy3 == pytest.approx(-1.44769)
 
+def test_get_all_minimum_coords():
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.ktn')
+    all_coords = ktn.get_all_minimum_coords()
+    assert all_coords.shape == (9, 3)
+    for i in range(ktn.n_minima):
+        assert np.all(all_coords[i, :] == ktn.get_minimum_coords(i))
+
+def test_get_all_minimum_energies():
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.ktn')
+    energies = ktn.get_all_minimum_energies()
+    assert energies.shape == (9,)
+    assert energies[2] == pytest.approx(-1.67184)
+    assert energies[3] == pytest.approx(-1.44769)
+
 def test_get_ts_coords():
     ktn = KineticTransitionNetwork()
     ktn.read_network(text_path=f'{current_dir}/test_data/',
@@ -339,6 +380,19 @@ def test_remove_minima():
     assert edges == [(0, 1), (2, 4), (2, 5), (2, 3), (3, 6)]
     assert ktn.n_ts == 5
 
+def test_remove_minima2():
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.ktn')
+    n_ts = ktn.n_ts
+    ktn.remove_minima([])
+    assert ktn.n_minima == 9
+    assert ktn.n_ts == n_ts
+    ktn.remove_minima([2, 5, 2])
+    assert ktn.n_minima == 7
+    assert ktn.n_ts == ktn.G.number_of_edges() == 5
+    assert list(ktn.G.nodes) == list(range(7))
+
 def test_remove_ts():
     ktn = KineticTransitionNetwork()
     ktn.read_network(text_path=f'{current_dir}/test_data/',
@@ -391,6 +445,16 @@ def test_remove_tss():
     assert edges == [(0, 1), (2, 8), (3, 6),
                      (3, 4), (4, 8), (4, 5)]
 
+def test_remove_tss2():
+    ktn = KineticTransitionNetwork()
+    ktn.read_network(text_path=f'{current_dir}/test_data/',
+                     text_string='.ktn_multipleTS')
+    ktn.remove_tss([(0, 1), (0, 1), (3, 7)])
+    assert ktn.n_ts == 6
+    assert ktn.n_ts == ktn.G.number_of_edges()
+    assert not ktn.G.has_edge(0, 1)
+    assert not ktn.G.has_edge(3, 7)
+
 def test_remove_all_tss():
     ktn = KineticTransitionNetwork()
     ktn.read_network(text_path=f'{current_dir}/test_data/',
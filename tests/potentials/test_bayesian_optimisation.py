@@ -44,3 +44,52 @@ def test_ucb_function():
     assert improv == pytest.approx(-0.66490006)
     improv = ucb.function(np.array([0.75, 1.1]))
     assert improv == pytest.approx(-0.61416774)
+
+def test_ei_function_batch():
+    model_data = ModelData(training_file=f'{current_dir}/test_data/training_bayesopt2.txt',
+                           response_file=f'{current_dir}/test_data/response_bayesopt2.txt')
+    gp = GaussianProcess(model_data=model_data, kernel_choice='RBF',
+                         kernel_bounds=[(1e-1, 1e2), (1e-5, 1e-1)])
+    ei = ExpectedImprovement(gaussian_process=gp, zeta=0.3)
+    improv = ei.function_batch(np.array([[0.5], [0.5]]))
+    assert np.all(improv == pytest.approx([0.03386785, 0.03386785]))
+
+def test_ucb_function_batch():
+    model_data = ModelData(training_file=f'{current_dir}/test_data/training_bayesopt1.txt',
+                           response_file=f'{current_dir}/test_data/response_bayesopt1.txt')
+    gp = GaussianProcess(model_data=model_data, kernel_choice='RBF',
+                         kernel_bounds=[(1e-1, 1e2), (1e-1, 1e2),
+                                        (1e-5, 1e-1)])
+    ucb = UpperConfidenceBound(gaussian_process=gp, zeta=0.1)
+    improv = ucb.function_batch(np.array([[0.0, 0.0], [0.75, 1.1]]))
+    assert np.all(improv == pytest.approx([-0.66490006, -0.61416774]))
+
+def test_ei_current_max():
+    model_data = ModelData(training_file=f'{current_dir}/test_data/training_bayesopt2.txt',
+                           response_file=f'{current_dir}/test_data/response_bayesopt2.txt')
+    gp = GaussianProcess(model_data=model_data, kernel_choice='RBF',
+                         kernel_bounds=[(1e-1, 1e2), (1e-5, 1e-1)])
+    ei = ExpectedImprovement(gaussian_process=gp, zeta=0.3)
+    assert ei.current_max() == pytest.approx(np.max(model_data.response))
+    assert ei.cached_response is model_data.response
+    gp.add_data(np.array([[0.5]]), np.array([100.0]))
+    assert ei.current_max() == pytest.approx(np.max(model_data.response))
+    assert ei.cached_response is model_data.response
+
+def test_ei_function_zero_std(mocker):
+    model_data = ModelData(training_file=f'{current_dir}/test_data/training_bayesopt2.txt',
+                           response_file=f'{current_dir}/test_data/response_bayesopt2.txt')
+    gp = GaussianProcess(model_data=model_data, kernel_choice='RBF',
+                         kernel_bounds=[(1e-1, 1e2), (1e-5, 1e-1)])
+    ei = ExpectedImprovement(gaussian_process=gp, zeta=0.1)
+    current_max = np.max(model_data.response)
+    mocker.patch.object(gp, 'function_and_std',
+                        return_value=(np.array([current_max+1.0]),
+                                      np.array([0.0])))
+    assert ei.function(np.array([0.5])) == pytest.approx(0.9)
+    mocker.patch.object(gp, 'function_and_std_batch',
+                        return_value=(np.array([current_max+1.0,
+                                                current_max-1.0]),
+                                      np.array([0.0, 0.0])))
+    improv = ei.function_batch(np.array([[0.5], [0.6]]))
+    assert np.all(improv == pytest.approx([0.9, 0.0]))
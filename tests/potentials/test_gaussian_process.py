@@ -49,6 +49,19 @@ def test_function_and_std_rbf():
     assert gp_mean == pytest.approx(12.295985976340937)
     assert gp_std == pytest.approx(3.21782038)
 
+def test_function_batch_rbf():
+    model_data = ModelData(training_file=f'{current_dir}/test_data/training_gp.txt',
+                           response_file=f'{current_dir}/test_data/response_gp.txt')
+    gp = GaussianProcess(model_data=model_data, kernel_choice='RBF',
+                         kernel_bounds=[(1e1, 1.00000001e1),
+                                        (1e1, 1.00000001e1),
+                                        (1e1, 1.00000001e1)],
+                         standardise_response=False)
+    positions = np.array([[0.0, 0.0], [0.5, -0.5], [1.0, 1.0]])
+    f_vals = gp.function_batch(positions)
+    assert np.all(f_vals == pytest.approx([gp.function(i)
+                                           for i in positions]))
+
 def test_function_rbf_fit():
     # Fit the rbf kernel
     model_data = ModelData(training_file=f'{current_dir}/test_data/training_gp.txt',
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from topsearch.potentials.potential import Potential
 from topsearch.potentials.test_functions import Camelback
 from topsearch.potentials.atomic import LennardJones
 from topsearch.data.coordinates import StandardCoordinates, AtomicCoordinates
@@ -75,3 +76,9 @@ def test_check_valid_ts_atomistic():
                           0.4446812400887467, 0.9551650938893821, 0.12220599655290978])
     valid_ts = lennard_jones.check_valid_ts(coords)
     assert valid_ts == True
+
+def test_function_batch():
+    potential = Potential()
+    positions = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    f_vals = potential.function_batch(positions)
+    assert np.all(f_vals == pytest.approx([0.0, 0.0, 0.0]))
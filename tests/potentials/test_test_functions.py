@@ -32,6 +32,13 @@ def test_quadratic_function2():
     position = np.array([1.0, 0.6])
     assert quadratic.function(position) == pytest.approx(1.36)
 
+def test_quadratic_function_batch():
+    quadratic = Quadratic()
+    positions = np.array([[0.0, 0.0], [1.0, 0.6], [-2.0, 1.0]])
+    f_vals = quadratic.function_batch(positions)
+    assert np.all(f_vals == pytest.approx([quadratic.function(i)
+                                           for i in positions]))
+
 def test_quadratic_gradient2():
     quadratic = Quadratic()
     position = np.array([1.0, 0.6])
@@ -103,6 +110,13 @@ def test_camel_hessian2():
     assert np.all(hess == pytest.approx(
         np.array([[8.0, 1.0], [1.0, -8.0]]), abs=1e-4))
 
+def test_camel_function_batch():
+    camelback = Camelback()
+    positions = np.array([[0.0, 0.0], [0.5, -0.2], [-1.5, 1.0]])
+    f_vals = camelback.function_batch(positions)
+    assert np.all(f_vals == pytest.approx([camelback.function(i)
+                                           for i in positions]))
+
 ###### SCHWEFEL FUNCTION ############
 
 def test_schwefel_function():
@@ -162,3 +176,11 @@ def test_schwefel_hessian2():
         np.array([[-0.20293101, 0.0,          0.0       ],
                   [ 0.0,        -0.1080025,   0.0       ],
                   [ 0.0,        0.0,          0.23874236]]), abs=1e-3))
+
+def test_schwefel_function_batch():
+    schwefel = Schwefel()
+    positions = np.array([[420.9687, 420.9687, 420.9687],
+                          [-100.0, 20.0, 300.0]])
+    f_vals = schwefel.function_batch(positions)
+    assert np.all(f_vals == pytest.approx([schwefel.function(i)
+                                           for i in positions]))
@@ -165,7 +165,7 @@ def test_select_minima():
                                  step_taking=step_taking)
     sampler = NetworkSampling(ktn, coords, basin_hopping, None, None, similarity)
     pairs = sampler.select_minima(coords, 'ConnectUnconnected', 2)
-    assert pairs == [[0, 7], [3, 4], [0, 6], [2, 3], [2, 6], [4, 7]]
+    assert pairs == [[0, 6], [0, 7], [2, 3], [2, 6], [3, 4], [4, 7]]
 
 def test_select_minima2():
     step_taking = StandardPerturbation(max_displacement=0.7,
@@ -181,8 +181,8 @@ def test_select_minima2():
                                  step_taking=step_taking)
     sampler = NetworkSampling(ktn, coords, basin_hopping, None, None, similarity)
     pairs = sampler.select_minima(coords, 'ClosestEnumeration', 2)
-    assert pairs == [[0, 1], [1, 2], [5, 8], [3, 7], [0, 3],
-                     [2, 3], [6, 7], [4, 5], [4, 8], [3, 6], [2, 8]]
+    assert pairs == [[0, 1], [0, 3], [1, 2], [2, 3], [2, 8], [3, 6],
+                     [3, 7], [4, 5], [4, 8], [5, 8], [6, 7]]
 
 def test_prepare_connection_attempt():
     coords = StandardCoordinates(ndim=2, bounds=[(-3.0, 3.0), (-2.0, 2.0)])